@@ -22,29 +22,73 @@ schema for.
 
 """
 
-import importlib.metadata
-from typing import Optional, Type
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
-import memoization
 import orjson
 
-from py_avro_schema._schemas import JSON_OPTIONS, Option, TypeNotSupportedError, schema
+import py_avro_schema._cache
+import py_avro_schema._schemas
+from py_avro_schema._cache import cache_by_identity, evict_oldest
+from py_avro_schema._schemas import (
+    JSON_OPTIONS_MASK,
+    JSONType,
+    Option,
+    TypeNotSupportedError,
+    schema,
+)
 from py_avro_schema._typing import DecimalMeta, DecimalType
 
-#: Library version, e.g. 1.0.0, taken from Git tags
-__version__ = importlib.metadata.version("py-avro-schema")
-
-
 __all__ = [
     "DecimalMeta",
     "DecimalType",
     "Option",
     "TypeNotSupportedError",
+    "clear_caches",
     "generate",
+    "generate_into",
+    "generate_many",
+    "make_generator",
 ]
 
 
-@memoization.cached
+def __getattr__(name: str) -> Any:
+    """
+    Return lazily evaluated module attributes
+
+    The library version ``__version__``, e.g. 1.0.0, taken from Git tags, is read from the package metadata on first
+    access only.
+    """
+    if name == "__version__":
+        import importlib.metadata
+
+        version = importlib.metadata.version("py-avro-schema")
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+#: Maximum number of schemas cached by :func:`generate`, set using environment variable ``PY_AVRO_SCHEMA_CACHE``
+_GENERATE_CACHE_MAXSIZE = py_avro_schema._cache.MAXSIZE
+#: Generated schemas by Python type id, namespace and options value, in least to most recently used order. Python types
+#: are stored alongside the schemas such that cached type ids cannot be re-used.
+_GENERATE_CACHE: Dict[Tuple[int, Optional[str], int], Tuple[Type, bytes]] = {}
+#: Distinct generated schemas, such that cached schemas which are equal share a single bytestring
+_GENERATE_CACHE_JSON: Dict[bytes, bytes] = {}
+#: Functions returned by :func:`make_generator`, such that their caches can be cleared too
+_GENERATORS: weakref.WeakSet[Callable[[Type], bytes]] = weakref.WeakSet()
+
+
 def generate(
     py_type: Type,
     *,
@@ -54,17 +98,179 @@ def generate(
     """
     Return an Avro schema as a JSON-formatted bytestring for a given Python class or instance
 
-    This function is cached and can be called repeatedly with the same arguments without any performance penalty.
+    This function is cached and can be called repeatedly with the same arguments without any performance penalty. The
+    cache holds up to 1024 schemas by default. Use environment variable ``PY_AVRO_SCHEMA_CACHE`` to set a different
+    maximum, or zero to disable caching. The same maximum applies to the caches of intermediate schema objects.
 
     :param py_type:   The Python class to generate a schema for.
     :param namespace: The Avro namespace to add to schemas.
     :param options:   Schema generation options as defined by :class:`Option` enum values. Specify multiple values like
                       this: ``Option.INT_32 | Option.FLOAT_32``.
     """
-    schema_dict = schema(py_type, namespace=namespace, options=options)
-    json_options = 0
-    for opt in JSON_OPTIONS:
-        if opt in options:
-            json_options |= opt.value
-    schema_json = orjson.dumps(schema_dict, option=json_options)
+    # Using the plain attribute Option._value_ as the Option.value property is relatively slow on this hot path
+    key = (id(py_type), namespace, options._value_)
+    # The cache is a plain dict without locks. Individual dict operations are atomic such that concurrent threads can
+    # only cause a schema to be generated more than once.
+    cached = _GENERATE_CACHE.pop(key, None)
+    if cached:
+        schema_json = cached[1]
+    else:
+        schema_dict = _schema_data(py_type, namespace, _schema_options(namespace, options))
+        schema_json = _dumps(schema_dict, options=options)
+        interned_json = _GENERATE_CACHE_JSON.get(schema_json)
+        if interned_json is None:
+            _GENERATE_CACHE_JSON[schema_json] = schema_json
+            evict_oldest(_GENERATE_CACHE_JSON, _GENERATE_CACHE_MAXSIZE)
+        else:
+            schema_json = interned_json
+    _GENERATE_CACHE[key] = (py_type, schema_json)  # (Re-)insert as most recently used
+    evict_oldest(_GENERATE_CACHE, _GENERATE_CACHE_MAXSIZE)
     return schema_json
+
+
+def _generate_cache_clear() -> None:
+    """Remove all cached schemas"""
+    _GENERATE_CACHE.clear()
+    _GENERATE_CACHE_JSON.clear()
+    _schema_data.cache_clear()  # type: ignore[attr-defined]
+
+
+def clear_caches() -> None:
+    """
+    Remove all cached schemas and intermediate schema objects
+
+    Schemas are cached by Python class, including by functions returned by :func:`make_generator`. Call this function
+    to release memory or after modifying classes in place, for example by changing their type annotations.
+    """
+    _generate_cache_clear()
+    for generator in list(_GENERATORS):  # A copy as generators may be garbage collected meanwhile
+        generator.cache_clear()  # type: ignore[attr-defined]
+    py_avro_schema._schemas.clear_caches()
+
+
+class _GenerateCacheInfo(NamedTuple):
+    """Statistics for the :func:`generate` cache"""
+
+    maxsize: int
+    currsize: int
+
+
+def _generate_cache_info() -> _GenerateCacheInfo:
+    """Return statistics for the :func:`generate` cache"""
+    return _GenerateCacheInfo(maxsize=_GENERATE_CACHE_MAXSIZE, currsize=len(_GENERATE_CACHE))
+
+
+generate.cache_clear = _generate_cache_clear  # type: ignore[attr-defined]
+generate.cache_info = _generate_cache_info  # type: ignore[attr-defined]
+
+
+def generate_into(
+    py_type: Type,
+    buffer: bytearray,
+    *,
+    namespace: Optional[str] = None,
+    options: Option = Option(0),
+) -> int:
+    """
+    Append an Avro schema as JSON-formatted bytes for a given Python class to a buffer and return the number of bytes
+    written
+
+    This avoids allocating a new bytestring for each call when writing schemas to a buffer which is sent elsewhere. The
+    schema is taken from the same cache as :func:`generate`.
+
+    :param py_type:   The Python class to generate a schema for.
+    :param buffer:    The buffer to append the schema to.
+    :param namespace: The Avro namespace to add to schemas.
+    :param options:   Schema generation options as defined by :class:`Option` enum values. Specify multiple values like
+                      this: ``Option.INT_32 | Option.FLOAT_32``.
+    """
+    schema_json = generate(py_type, namespace=namespace, options=options)
+    buffer.extend(schema_json)
+    return len(schema_json)
+
+
+def generate_many(
+    py_types: Sequence[Type],
+    *,
+    namespace: Optional[str] = None,
+    options: Option = Option(0),
+) -> List[bytes]:
+    """
+    Return Avro schemas as JSON-formatted bytestrings for a sequence of Python classes
+
+    Named schemas are defined once only across the whole sequence. If a named schema is already defined in an earlier
+    schema, later schemas reference it by its full name. Schemas must therefore be parsed in the order they are
+    returned.
+
+    :param py_types:  The Python classes to generate schemas for.
+    :param namespace: The Avro namespace to add to schemas.
+    :param options:   Schema generation options as defined by :class:`Option` enum values. Specify multiple values like
+                      this: ``Option.INT_32 | Option.FLOAT_32``.
+    """
+    names: List[str] = []
+    return [
+        _dumps(schema(py_type, namespace=namespace, names=names, options=options), options=options)
+        for py_type in py_types
+    ]
+
+
+def make_generator(*, namespace: Optional[str] = None, options: Option = Option(0)) -> Callable[[Type], bytes]:
+    """
+    Return a function which generates Avro schemas as JSON-formatted bytestrings for a fixed namespace and options
+
+    Long-running applications using the same namespace and options throughout may call this function once and re-use
+    the returned function. The returned function has its own cache, sized like the :func:`generate` cache and cleared
+    by :func:`clear_caches`.
+
+    Example
+    -------
+
+    >>> import py_avro_schema as pas
+    >>> generate = pas.make_generator(options=pas.Option.INT_32)
+    >>> generate(int)
+    b'"int"'
+
+    :param namespace: The Avro namespace to add to schemas.
+    :param options:   Schema generation options as defined by :class:`Option` enum values. Specify multiple values like
+                      this: ``Option.INT_32 | Option.FLOAT_32``.
+    """
+
+    @cache_by_identity
+    def generate_(py_type: Type) -> bytes:
+        """Return an Avro schema as a JSON-formatted bytestring for a given Python class"""
+        return _dumps(schema(py_type, namespace=namespace, options=options), options=options)
+
+    _GENERATORS.add(generate_)
+    return generate_
+
+
+def _schema_options(namespace: Optional[str], options: Option) -> Option:
+    """
+    Return the options relevant to schema data in a canonical form, such that equivalent options share cached data
+
+    Schema data does not depend on JSON options, such that changing JSON options only re-serializes the data. Likewise,
+    the automatic namespace module option is irrelevant if namespaces are not populated automatically.
+    """
+    options_value = options._value_ & ~JSON_OPTIONS_MASK
+    if namespace is not None or options_value & Option.NO_AUTO_NAMESPACE.value:
+        options_value &= ~Option.AUTO_NAMESPACE_MODULE.value
+    return Option(options_value)
+
+
+@cache_by_identity
+def _schema_data(py_type: Type, namespace: Optional[str], options: Option) -> JSONType:
+    """
+    Return the schema data for a given Python type
+
+    The returned data is cached and must not be modified.
+    """
+    return schema(py_type, namespace=namespace, options=options)
+
+
+def _dumps(schema_data: JSONType, options: Option) -> bytes:
+    """Serialize schema data to JSON, applying any JSON options"""
+    json_options = options.value & JSON_OPTIONS_MASK
+    if json_options:
+        return orjson.dumps(schema_data, option=json_options)
+    else:
+        return orjson.dumps(schema_data)  # Default options, nothing to parse
@@ -0,0 +1,112 @@
+# Copyright 2022 J.P. Morgan Chase & Co.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+"""
+Caches for functions of Python types
+"""
+
+import functools
+import os
+import weakref
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+
+def maxsize_from_env() -> int:
+    """Return the maximum number of items in each cache, set using environment variable ``PY_AVRO_SCHEMA_CACHE``"""
+    value = os.environ.get("PY_AVRO_SCHEMA_CACHE", "1024")
+    try:
+        maxsize = int(value)
+    except ValueError:
+        maxsize = -1
+    if maxsize < 0:
+        raise ValueError(
+            f"Environment variable PY_AVRO_SCHEMA_CACHE must be a non-negative integer. Given value: {value!r}"
+        )
+    return maxsize
+
+
+#: Maximum number of items in each cache, set using environment variable ``PY_AVRO_SCHEMA_CACHE``. Zero disables
+#: caching.
+MAXSIZE = maxsize_from_env()
+
+
+def cache_by_identity(func: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Decorate a function of a Python type and any further hashable arguments with a least-recently-used cache keyed by
+    the type's identity
+
+    Types which compare equal may still differ, for example ``Union[int, str] == Union[str, int]``. Caching by equality
+    would return the result for whichever of those types was seen first. Types are stored alongside the results such
+    that cached type ids cannot be re-used. Types need not be hashable, for example
+    ``Annotated[str, {"key": "value"}]``.
+
+    The cache is bounded such that types created dynamically can be garbage collected once evicted.
+    """
+    cache: Dict[Tuple[Any, ...], Tuple[Any, _T]] = {}
+
+    @functools.wraps(func)
+    def wrapper(py_type, *args):
+        """Return the cached result for the given type and arguments"""
+        key = (id(py_type), *args)
+        cached = cache.pop(key, None)
+        if cached is None:
+            result = func(py_type, *args)
+        else:
+            result = cached[1]
+        cache[key] = (py_type, result)  # (Re-)insert as most recently used
+        if len(cache) > MAXSIZE:
+            evict_oldest(cache, MAXSIZE)
+        return result
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+def evict_oldest(cache: Dict, maxsize: int) -> None:
+    """
+    Remove the oldest or least recently used items from a cache dict until it is within a given maximum size or empty
+
+    Items are evicted after inserting new items, such that concurrent threads each evicting items cannot leave the
+    cache larger than its maximum size.
+    """
+    while len(cache) > maxsize and cache:
+        try:
+            del cache[next(iter(cache))]
+        except (KeyError, RuntimeError):
+            pass  # Cache concurrently modified by another thread, try again
+
+
+def cache_weakly(func: Callable[[Any], _T]) -> Callable[[Any], _T]:
+    """
+    Decorate a function of a single class or function with a cache which does not keep the class or function alive
+
+    Cached return values must not reference the class or function itself. Objects which cannot be weakly referenced
+    are passed to the function directly.
+    """
+    cache: weakref.WeakKeyDictionary[Any, _T] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def wrapper(obj):
+        """Return the cached result if the object can be weakly referenced"""
+        try:
+            return cache[obj]
+        except KeyError:
+            pass
+        except TypeError:  # Objects which cannot be weakly referenced or hashed
+            return func(obj)
+        result = cache[obj] = func(obj)
+        return result
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
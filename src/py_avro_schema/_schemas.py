@@ -18,11 +18,14 @@ from __future__ import annotations
 
 import abc
 import collections.abc
+import copy
 import dataclasses
 import datetime
 import decimal
 import enum
+import functools
 import inspect
+import operator
 import re
 import sys
 import types
@@ -49,6 +52,7 @@ import orjson
 import typeguard
 
 import py_avro_schema._typing
+from py_avro_schema._cache import cache_by_identity, cache_weakly
 
 if TYPE_CHECKING:
     # Pydantic not necessarily required at runtime
@@ -60,7 +64,32 @@ JSONObj = Dict[str, Any]
 JSONArray = List[Any]
 JSONType = Union[JSONStr, JSONObj, JSONArray]
 
-NamesType = List[str]
+
+class Names:
+    """Avro schema names defined so far, supporting fast membership tests"""
+
+    __slots__ = ("names", "_names_set")
+
+    def __init__(self, names: List[str]):
+        """
+        Avro schema names defined so far
+
+        :param names: List of schema names, appended to whenever a new name is added.
+        """
+        self.names = names
+        self._names_set = set(names)
+
+    def __contains__(self, name: str) -> bool:
+        """Whether a given schema name is already defined"""
+        return name in self._names_set
+
+    def append(self, name: str) -> None:
+        """Add a newly defined schema name"""
+        self.names.append(name)
+        self._names_set.add(name)
+
+
+NamesType = Names
 
 
 class TypeNotSupportedError(TypeError):
@@ -123,12 +152,26 @@ class Option(enum.Flag):
 
 
 JSON_OPTIONS = [opt for opt in Option if opt.name and opt.name.startswith("JSON_")]
+#: Bitmask of all JSON options, corresponding with the :mod:`orjson` option values
+JSON_OPTIONS_MASK = functools.reduce(operator.or_, (opt.value for opt in JSON_OPTIONS), 0)
+
+# Option values for testing options using bitwise operators, which is faster than testing Option membership
+_OPT_AUTO_NAMESPACE_MODULE = Option.AUTO_NAMESPACE_MODULE.value
+_OPT_DEFAULTS_MANDATORY = Option.DEFAULTS_MANDATORY.value
+_OPT_FLOAT_32 = Option.FLOAT_32.value
+_OPT_INT_32 = Option.INT_32.value
+_OPT_LOGICAL_JSON_STRING = Option.LOGICAL_JSON_STRING.value
+_OPT_MILLISECONDS = Option.MILLISECONDS.value
+_OPT_NO_AUTO_NAMESPACE = Option.NO_AUTO_NAMESPACE.value
+_OPT_NO_DOC = Option.NO_DOC.value
+_OPT_USE_CLASS_ALIAS = Option.USE_CLASS_ALIAS.value
+_OPT_USE_FIELD_ALIAS = Option.USE_FIELD_ALIAS.value
 
 
 def schema(
     py_type: Type,
     namespace: Optional[str] = None,
-    names: Optional[NamesType] = None,
+    names: Optional[List[str]] = None,
     options: Option = Option(0),
 ) -> JSONType:
     """
@@ -145,7 +188,7 @@ def schema(
     if names is None:
         names = []
     schema_obj = _schema_obj(py_type, namespace=namespace, options=options)
-    schema_data = schema_obj.data(names=names)
+    schema_data = schema_obj.data(names=Names(names))
     return schema_data
 
 
@@ -153,24 +196,59 @@ def _schema_obj(py_type: Type, namespace: Optional[str] = None, options: Option
     """
     Dispatch to relevant schema classes
 
+    Schema objects are cached and shared between callers. They must not be modified.
+
     :param py_type:   The Python class to generate a schema for.
     :param namespace: The Avro namespace to add to schemas.
     :param options:   Schema generation options.
     """
-    # Find concrete Schema subclasses defined in the current module
+    return _schema_obj_cached(py_type, namespace, options)
+
+
+@cache_by_identity
+def _schema_obj_cached(py_type: Type, namespace: Optional[str], options: Option) -> "Schema":
+    """Dispatch to relevant schema classes, caching the schema object"""
+    return _schema_obj_uncached(py_type, namespace=namespace, options=options)
+
+
+def _schema_obj_uncached(py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)) -> "Schema":
+    """
+    Dispatch to relevant schema classes without caching
+
+    :param py_type:   The Python class to generate a schema for.
+    :param namespace: The Avro namespace to add to schemas.
+    :param options:   Schema generation options.
+    """
+    if type(py_type) is type:  # Plain classes only, these are always hashable
+        schema_class = _SCHEMA_CLASSES_BY_TYPE.get(py_type)
+    else:
+        schema_class = _SCHEMA_CLASSES_BY_ORIGIN.get(get_origin(py_type))
+    if schema_class:
+        return schema_class(py_type, namespace=namespace, options=options)
     # TODO: make this pluggable and accept additional classes
-    schema_classes = inspect.getmembers(
-        sys.modules[__name__],
-        lambda obj: inspect.isclass(obj) and issubclass(obj, Schema) and not inspect.isabstract(obj),
-    )
-    for _, schema_class in schema_classes:
+    for schema_class in _SCHEMA_CLASSES:
         # Find the first schema class that handles py_type
-        schema_obj = schema_class(py_type, namespace=namespace, options=options)  # type: ignore
-        if schema_obj:
-            return schema_obj
+        if schema_class.handles_type(py_type):
+            return schema_class(py_type, namespace=namespace, options=options)
     raise TypeNotSupportedError(f"Cannot generate Avro schema for Python type {py_type}")
 
 
+def clear_caches() -> None:
+    """Remove all cached schema objects and type introspection results"""
+    _CHECK_TYPE_CACHE.clear()
+    for func in (
+        _doc_for_class,
+        _is_class,
+        _is_dict_str_any,
+        _is_list_dict_str_any,
+        _module_for_class,
+        _origin_and_args,
+        _schema_obj_cached,
+        _type_from_annotated,
+    ):
+        func.cache_clear()  # type: ignore[union-attr]
+
+
 # See https://avro.apache.org/docs/1.11.1/specification/#names
 _AVRO_NAME_PATTERN = re.compile(r"^[A-Za-z]([A-Za-z0-9_])*$")
 
@@ -185,18 +263,9 @@ def validate_name(value: str) -> str:
 class Schema(abc.ABC):
     """Schema base"""
 
-    def __new__(cls, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
-        """
-        Create an instance of this schema class if it handles py_type
+    __slots__ = ("py_type", "options", "_options_value", "_namespace", "_resolved_namespace")
 
-        :param py_type:   The Python class to generate a schema for.
-        :param namespace: The Avro namespace to add to schemas.
-        :param options:   Schema generation options.
-        """
-        if cls.handles_type(py_type):
-            return super().__new__(cls)
-        else:
-            return None
+    _resolved_namespace: Optional[str]  # Set on first access of the namespace property
 
     def __init__(self, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
         """
@@ -208,6 +277,7 @@ class Schema(abc.ABC):
         """
         self.py_type = py_type
         self.options = options
+        self._options_value = options.value
         self._namespace = namespace  # Namespace override
 
     @property
@@ -218,10 +288,18 @@ class Schema(abc.ABC):
     @property
     def namespace(self) -> Optional[str]:
         """The namespace, taking into account auto-namespace options and any override"""
-        if self._namespace is None and Option.NO_AUTO_NAMESPACE not in self.options:
-            module = inspect.getmodule(self.py_type)
+        try:
+            return self._resolved_namespace
+        except AttributeError:  # Not resolved yet
+            self._resolved_namespace = self._resolve_namespace()
+            return self._resolved_namespace
+
+    def _resolve_namespace(self) -> Optional[str]:
+        """Return the namespace, taking into account auto-namespace options and any override"""
+        if self._namespace is None and not self._options_value & _OPT_NO_AUTO_NAMESPACE:
+            module = _module_for_class(self.py_type)
             if module and module.__name__ != "builtin":
-                if Option.AUTO_NAMESPACE_MODULE in self.options:
+                if self._options_value & _OPT_AUTO_NAMESPACE_MODULE:
                     return module.__name__
                 else:
                     return module.__name__.split(".", 1)[0]  # top-level package
@@ -249,51 +327,69 @@ class Schema(abc.ABC):
 class PrimitiveSchema(Schema):
     """An Avro primitive schema for a given Python type"""
 
+    __slots__ = ("primitive_type",)
+
     # TODO: implement make_default for bool
 
-    primitive_types = [
-        # Tuple of (Python type, whether to include subclasses too, Avro schema)
-        (bool, True, "boolean"),
-        (bytes, True, "bytes"),
-        (float, True, "double"),  # Return "double" (64 bit) schema for Python floats by default
-        (int, True, "long"),  # Return "long" (64 bit) schema for Python integers by default
-        (str, False, "string"),  # :class:`StrSubclassSchema` handles string subclasses
-        (type(None), False, "null"),
-    ]
+    #: Avro schemas for Python types, excluding subclasses. :class:`StrSubclassSchema` handles string subclasses.
+    exact_types = {
+        str: "string",
+        type(None): "null",
+    }
+    #: Avro schemas for Python types, including subclasses. Order matters as booleans are integers too.
+    subclass_types = {
+        bool: "boolean",
+        bytes: "bytes",
+        float: "double",  # Return "double" (64 bit) schema for Python floats by default
+        int: "long",  # Return "long" (64 bit) schema for Python integers by default
+    }
+    _subclass_bases = tuple(subclass_types)
 
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
-        return any(
-            _is_class(py_type, type_, include_subclasses=include_subclasses)
-            for type_, include_subclasses, _ in cls.primitive_types
-        )
+        py_type = _type_from_annotated(py_type)
+        return isinstance(py_type, type) and (py_type in cls.exact_types or issubclass(py_type, cls._subclass_bases))
 
-    def data(self, names: NamesType) -> JSONStr:
-        """Return the schema data"""
-        if Option.INT_32 in self.options and issubclass(self.py_type, int):
-            # If option is set to use 32 bit integers, return "int" schema instead of "double
-            return "int"
-        elif Option.FLOAT_32 in self.options and issubclass(self.py_type, float):
-            # If option is set to use 32 bit floats, return "float" schema instead of "double"
-            return "float"
+    def __init__(self, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
+        """
+        An Avro primitive schema for a given Python type
+
+        :param py_type:   The Python class to generate a schema for.
+        :param namespace: The Avro namespace to add to schemas.
+        :param options:   Schema generation options.
+        """
+        super().__init__(py_type, namespace=namespace, options=options)
+        py_type = _type_from_annotated(py_type)
+        if py_type in self.exact_types:
+            self.primitive_type = self.exact_types[py_type]
         else:
             # We're guaranteed a match since :meth:`handles_types` applies first
-            return next(
-                data
-                for type_, include_subclasses, data in self.primitive_types
-                if _is_class(self.py_type, type_, include_subclasses=include_subclasses)
+            self.primitive_type = next(
+                data for type_, data in self.subclass_types.items() if issubclass(py_type, type_)
             )
+        if self.primitive_type == "long" and self._options_value & _OPT_INT_32:
+            # If option is set to use 32 bit integers, return "int" schema instead of "long"
+            self.primitive_type = "int"
+        elif self.primitive_type == "double" and self._options_value & _OPT_FLOAT_32:
+            # If option is set to use 32 bit floats, return "float" schema instead of "double"
+            self.primitive_type = "float"
+
+    def data(self, names: NamesType) -> JSONStr:
+        """Return the schema data"""
+        return self.primitive_type
 
 
 class StrSubclassSchema(Schema):
     """An Avro string schema for a Python subclass of str, with a custom property referencing the class' fullname"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type[str]) -> bool:
         """Whether this schema class can represent a given Python class"""
         return (
-            inspect.isclass(py_type)
+            isinstance(py_type, type)
             and issubclass(py_type, str)
             and py_type is not str
             # Enums are always modelled as enum schemas, even when subclassing str
@@ -314,6 +410,8 @@ class StrSubclassSchema(Schema):
 class LiteralSchema(Schema):
     """An Avro schema of any type for a Python Literal type, e.g. ``Literal[""]``"""
 
+    __slots__ = ("literal_value_schema",)
+
     def __init__(self, py_type: Type[Any], namespace: Optional[str] = None, options: Option = Option(0)):
         """
         An Avro schema of any type for a Python Literal type, e.g. ``Literal[""]``
@@ -336,8 +434,8 @@ class LiteralSchema(Schema):
     @classmethod
     def handles_type(cls, py_type: Type[Any]) -> bool:
         """Whether this schema class can represent a given Python class"""
-        py_type = _type_from_annotated(py_type)
-        return get_origin(py_type) is Literal
+        origin, _ = _origin_and_args(py_type)
+        return origin is Literal
 
     def data(self, names: NamesType) -> JSONType:
         """Return the schema data"""
@@ -347,6 +445,8 @@ class LiteralSchema(Schema):
 class DictAsJSONSchema(Schema):
     """An Avro string schema representing a Python Dict[str, Any] or List[Dict[str, Any]] assuming JSON serialization"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -354,7 +454,7 @@ class DictAsJSONSchema(Schema):
 
     def data(self, names: NamesType) -> JSONObj:
         """Return the schema data"""
-        type_ = "string" if Option.LOGICAL_JSON_STRING in self.options else "bytes"
+        type_ = "string" if self._options_value & _OPT_LOGICAL_JSON_STRING else "bytes"
         return {
             "type": type_,
             "logicalType": "json",
@@ -368,6 +468,8 @@ class DictAsJSONSchema(Schema):
 class UUIDSchema(Schema):
     """An Avro string schema representing a Python UUID object"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -391,9 +493,21 @@ class UUIDSchema(Schema):
         return ""
 
 
+def _timedelta_micros(timedelta: datetime.timedelta) -> int:
+    """Return a time difference as an exact number of microseconds, avoiding floating point rounding"""
+    return (timedelta.days * 86_400 + timedelta.seconds) * 1_000_000 + timedelta.microseconds
+
+
+#: The Unix epoch as a day number and as a datetime, for converting Python default values to Avro default values
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
 class DateSchema(Schema):
     """An Avro logical type date schema for a given Python date type"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -405,12 +519,14 @@ class DateSchema(Schema):
 
     def make_default(self, py_default: datetime.date) -> int:
         """Return an Avro schema compliant default value for a given Python value"""
-        return (py_default - datetime.date(1970, 1, 1)).days
+        return py_default.toordinal() - _EPOCH_ORDINAL
 
 
 class TimeSchema(Schema):
     """An Avro logical type time (microseconds precision) schema for a given Python time type"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -418,7 +534,7 @@ class TimeSchema(Schema):
 
     def data(self, names: NamesType) -> JSONObj:
         """Return the schema data"""
-        logical_type = "time-millis" if Option.MILLISECONDS in self.options else "time-micros"
+        logical_type = "time-millis" if self._options_value & _OPT_MILLISECONDS else "time-micros"
         type_by_logical_type = {
             "time-millis": "int",
             "time-micros": "long",
@@ -427,15 +543,16 @@ class TimeSchema(Schema):
 
     def make_default(self, py_default: datetime.time) -> int:
         """Return an Avro schema compliant default value for a given Python value"""
-        # Force UTC as we're concerned only about time diffs
-        dt1 = datetime.datetime(1, 1, 1, tzinfo=datetime.timezone.utc)
-        dt2 = datetime.datetime.combine(datetime.datetime(1, 1, 1), py_default, tzinfo=datetime.timezone.utc)
-        return int((dt2 - dt1).total_seconds() * 1e6)
+        # Any time zone is ignored as we're concerned only about the time since midnight
+        seconds = (py_default.hour * 60 + py_default.minute) * 60 + py_default.second
+        return seconds * 1_000_000 + py_default.microsecond
 
 
 class DateTimeSchema(Schema):
     """An Avro logical type timestamp (microseconds precision) schema for a given Python datetime type"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -443,19 +560,21 @@ class DateTimeSchema(Schema):
 
     def data(self, names: NamesType) -> JSONObj:
         """Return the schema data"""
-        logical_type = "timestamp-millis" if Option.MILLISECONDS in self.options else "timestamp-micros"
+        logical_type = "timestamp-millis" if self._options_value & _OPT_MILLISECONDS else "timestamp-micros"
         return {"type": "long", "logicalType": logical_type}
 
     def make_default(self, py_default: datetime.datetime) -> int:
         """Return an Avro schema compliant default value for a given Python value"""
         if not py_default.tzinfo:
             raise TypeError(f"Default {py_default!r} must be timezone-aware")
-        return int((py_default - datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc)).total_seconds() * 1e6)
+        return _timedelta_micros(py_default - _EPOCH_UTC)
 
 
 class TimeDeltaSchema(Schema):
     """An Avro logical type duration schema for a given Python timedelta type"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -481,6 +600,8 @@ class TimeDeltaSchema(Schema):
 class ForwardSchema(Schema):
     """A forward/circular reference which in Avro is just the schema name"""
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -506,6 +627,8 @@ class DecimalSchema(Schema):
        >>> my_decimal: Annotated[decimal.Decimal, (4, 2)] = decimal.Decimal("12.34")
     """
 
+    __slots__ = ()
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -572,10 +695,8 @@ class DecimalSchema(Schema):
                 f"Default value {py_default} has scale {-exp} which is greater than the schema's scale {scale}"
             )
 
-        unscaled_datum = 0
-        for digit in digits:
-            unscaled_datum = (unscaled_datum * 10) + digit
-        unscaled_datum = 10**delta * unscaled_datum
+        # Parsing the digits as a string is faster than accumulating them one by one
+        unscaled_datum = 10**delta * int("".join(map(str, digits)))
         bytes_req = (unscaled_datum.bit_length() + 8) // 8
         if sign:
             unscaled_datum = -unscaled_datum
@@ -588,11 +709,12 @@ class DecimalSchema(Schema):
 class SequenceSchema(Schema):
     """An Avro array schema for a given Python sequence"""
 
+    __slots__ = ("items_schema",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
-        py_type = _type_from_annotated(py_type)
-        origin = get_origin(py_type)
+        origin, _ = _origin_and_args(py_type)
         return _is_class(origin, collections.abc.Sequence)
 
     def __init__(
@@ -631,14 +753,14 @@ class SequenceSchema(Schema):
 class DictSchema(Schema):
     """An Avro map schema for a given Python mapping"""
 
+    __slots__ = ("values_schema",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
-        py_type = _type_from_annotated(py_type)
-        origin = get_origin(py_type)
-        args = get_args(py_type)
-        # TODO: should we return false if args does not have 2 items?
-        return _is_class(origin, collections.abc.Mapping) and args[1] != Any  # dict values must be strongly typed
+        origin, args = _origin_and_args(py_type)
+        # Dict values must be strongly typed
+        return _is_class(origin, collections.abc.Mapping) and len(args) == 2 and args[1] != Any
 
     def __init__(
         self,
@@ -671,18 +793,13 @@ class DictSchema(Schema):
 class UnionSchema(Schema):
     """An Avro union schema for a given Python union type"""
 
+    __slots__ = ("item_schemas",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
-        py_type = _type_from_annotated(py_type)
-        origin = get_origin(py_type)
-
-        # Support for `X | Y` syntax available in Python 3.10+
-        # equivalent to `typing.Union[X, Y]`
-        union_type = getattr(types, "UnionType", None)
-        if union_type:
-            return origin == Union or origin == union_type
-        return origin == Union
+        origin, _ = _origin_and_args(py_type)
+        return origin is Union or origin is _UNION_TYPE
 
     def __init__(self, py_type: Type[Union[Any]], namespace: Optional[str] = None, options: Option = Option(0)):
         """
@@ -709,19 +826,24 @@ class UnionSchema(Schema):
         else:
             return unique_schemas[0]
 
-    def sort_item_schemas(self, default_value: Any) -> None:
-        """Re-order the union's schemas such that the first item corresponds with a record field's default value"""
-        default_index = -1
-        for i, item_schema in enumerate(self.item_schemas):
-            try:
-                typeguard.check_type(default_value, item_schema.py_type)
-                default_index = i
-                break
-            except typeguard.TypeCheckError:
-                continue
-        if default_index > 0:
-            default_item_schema = self.item_schemas.pop(default_index)
-            self.item_schemas.insert(0, default_item_schema)
+    def sort_item_schemas(self, default_value: Any) -> List[Schema]:
+        """
+        Return the union's schemas re-ordered such that the first item corresponds with a record field's default value
+
+        The union schema itself is not modified. If no re-ordering is required, the schemas list itself is returned.
+        """
+        item_types = [item_schema.py_type for item_schema in self.item_schemas]
+        if default_value is None and type(None) in item_types:
+            # By far the most common case, optional fields defaulting to None. This avoids checking None against the
+            # other item types, which may require typeguard.
+            default_index = item_types.index(type(None))
+        else:
+            default_index = next((i for i, t in enumerate(item_types) if _check_type(default_value, t)), 0)
+        if default_index:
+            item_schemas = list(self.item_schemas)
+            item_schemas.insert(0, item_schemas.pop(default_index))
+            return item_schemas
+        return self.item_schemas
 
     def make_default(self, py_default: Any) -> JSONType:
         """Return an Avro schema compliant default value for a given Python value"""
@@ -735,6 +857,10 @@ class UnionSchema(Schema):
 class NamedSchema(Schema):
     """A named Avro schema base class"""
 
+    __slots__ = ("_unwrapped_py_type", "_name", "_fullname")
+
+    _fullname: str  # Set on first access of the fullname property
+
     def __init__(self, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
         """
         A named Avro schema base class
@@ -744,8 +870,9 @@ class NamedSchema(Schema):
         :param options:   Schema generation options.
         """
         super().__init__(py_type, namespace=namespace, options=options)
-        py_type = _type_from_annotated(py_type)
-        self.name = py_type.__name__
+        # The class itself if annotated, such that subclasses do not need to unwrap it again
+        self._unwrapped_py_type = _type_from_annotated(py_type)
+        self.name = self._unwrapped_py_type.__name__
 
     def __str__(self):
         """Human rendering of the schema"""
@@ -760,14 +887,20 @@ class NamedSchema(Schema):
     def name(self, value: str):
         """Validate and set the schema name"""
         self._name = validate_name(value)
+        try:
+            del self._fullname
+        except AttributeError:  # Full name not resolved yet
+            pass
 
     @property
-    def fullname(self):
+    def fullname(self) -> str:
         """The schema's full name including the namespace if set"""
-        if self.namespace:
-            return ".".join((self.namespace, self.name))
-        else:
-            return self.name
+        try:
+            return self._fullname
+        except AttributeError:  # Not resolved yet
+            namespace = self.namespace
+            self._fullname = ".".join((namespace, self.name)) if namespace else self.name
+            return self._fullname
 
     def data(self, names: NamesType) -> JSONType:
         """Return the schema data"""
@@ -785,6 +918,8 @@ class NamedSchema(Schema):
 class EnumSchema(NamedSchema):
     """An Avro enum schema for a Python enum with string values"""
 
+    __slots__ = ("symbols",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -799,10 +934,10 @@ class EnumSchema(NamedSchema):
         :param options:   Schema generation options.
         """
         super().__init__(py_type, namespace=namespace, options=options)
-        py_type = _type_from_annotated(py_type)
+        py_type = self._unwrapped_py_type
         self.symbols = [member.value for member in py_type]
-        symbol_types = {type(symbol) for symbol in self.symbols}
-        if symbol_types != {str}:
+        if not self.symbols or not all(type(symbol) is str for symbol in self.symbols):
+            symbol_types = {type(symbol) for symbol in self.symbols}
             raise TypeError(f"Avro enum schema members must be strings. {py_type} uses {symbol_types} values.")
 
     def data_before_deduplication(self, names: NamesType) -> JSONObj:
@@ -810,7 +945,7 @@ class EnumSchema(NamedSchema):
         enum_schema = {
             "type": "enum",
             "name": self.name,
-            "symbols": self.symbols,
+            "symbols": list(self.symbols),  # A copy as callers may modify the schema data
             # This is the default for the enum, not the default value for a record field using the enum type! See Avro
             # schema specification for use. For now, we force the default value to be the first symbol. This means that
             # if the writer schema has an additional member that the reader schema does NOT have, the reader will simply
@@ -820,7 +955,7 @@ class EnumSchema(NamedSchema):
         }
         if self.namespace is not None:
             enum_schema["namespace"] = self.namespace
-        if Option.NO_DOC not in self.options:
+        if not self._options_value & _OPT_NO_DOC:
             doc = _doc_for_class(self.py_type)
             if doc:
                 enum_schema["doc"] = doc
@@ -830,16 +965,27 @@ class EnumSchema(NamedSchema):
 class RecordSchema(NamedSchema):
     """An Avro record schema base class"""
 
-    def __init__(self, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
+    __slots__ = ("_record_fields",)
+
+    _record_fields: collections.abc.Sequence[RecordField]  # Set on first access of the record_fields property
+
+    @property
+    def record_fields(self) -> collections.abc.Sequence[RecordField]:
         """
-        An Avro record schema base class
+        The record's fields
 
-        :param py_type:   The Python class to generate a schema for.
-        :param namespace: The Avro namespace to add to schemas.
-        :param options:   Schema generation options.
+        Fields are created on first access only, such that field schemas are not generated when only a default value
+        is required for this record.
         """
-        super().__init__(py_type, namespace=namespace, options=options)
-        self.record_fields: collections.abc.Sequence[RecordField] = []
+        try:
+            return self._record_fields
+        except AttributeError:  # Not created yet
+            self._record_fields = self._make_record_fields()
+            return self._record_fields
+
+    def _make_record_fields(self) -> collections.abc.Sequence[RecordField]:
+        """Return the record's fields"""
+        return []
 
     def data_before_deduplication(self, names: NamesType) -> JSONObj:
         """Return the schema data"""
@@ -850,7 +996,7 @@ class RecordSchema(NamedSchema):
         }
         if self.namespace is not None:
             record_schema["namespace"] = self.namespace
-        if Option.NO_DOC not in self.options:
+        if not self._options_value & _OPT_NO_DOC:
             doc = _doc_for_class(self.py_type)
             if doc:
                 record_schema["doc"] = doc
@@ -860,6 +1006,19 @@ class RecordSchema(NamedSchema):
 class RecordField:
     """An Avro record field"""
 
+    __slots__ = (
+        "py_type",
+        "name",
+        "_namespace",
+        "default",
+        "docs",
+        "options",
+        "_options_value",
+        "schema",
+        "_data_extras",
+        "_mutable_default",
+    )
+
     def __init__(
         self,
         py_type: Type,
@@ -880,20 +1039,35 @@ class RecordField:
         :param options:   Schema generation options
         """
         self.py_type = py_type
-        self.name = name
+        self.name = sys.intern(name)  # Field names recur across many schemas, share a single string object
         self._namespace = namespace
         self.default = default
         self.docs = docs
         self.options = options
+        self._options_value = options.value
         self.schema = _schema_obj(self.py_type, namespace=self._namespace, options=options)
 
-        if self.default != dataclasses.MISSING:
+        # Schema data items other than name and type, which are the same each time the schema data is generated
+        self._data_extras: JSONObj = {}
+        # Whether the default value is a list or dict, which is copied each time as callers may modify the schema data
+        self._mutable_default = False
+
+        if self.default is not dataclasses.MISSING:
             if isinstance(self.schema, UnionSchema):
-                self.schema.sort_item_schemas(self.default)
-            typeguard.check_type(self.default, self.py_type)
+                item_schemas = self.schema.sort_item_schemas(self.default)
+                if item_schemas is not self.schema.item_schemas:
+                    # Re-order a copy as cached union schemas are shared between fields with the same type
+                    self.schema = copy.copy(self.schema)
+                    self.schema.item_schemas = item_schemas
+            if not _check_type(self.default, self.py_type):
+                typeguard.check_type(self.default, self.py_type)  # Raises an error describing the mismatch
+            self._data_extras["default"] = default = self.schema.make_default(self.default)
+            self._mutable_default = isinstance(default, (list, dict))
         else:
-            if Option.DEFAULTS_MANDATORY in self.options:
+            if self._options_value & _OPT_DEFAULTS_MANDATORY:
                 raise TypeError(f"Default value for field {self} is missing")
+        if self.docs and not self._options_value & _OPT_NO_DOC:
+            self._data_extras["doc"] = self.docs
 
     def __str__(self):
         """Human representation of the field"""
@@ -904,17 +1078,18 @@ class RecordField:
         field_data = {
             "name": self.name,
             "type": self.schema.data(names=names),
+            **self._data_extras,
         }
-        if self.default != dataclasses.MISSING:
-            field_data["default"] = self.schema.make_default(self.default)
-        if self.docs and Option.NO_DOC not in self.options:
-            field_data["doc"] = self.docs
+        if self._mutable_default:
+            field_data["default"] = copy.deepcopy(field_data["default"])
         return field_data
 
 
 class DataclassSchema(RecordSchema):
     """An Avro record schema for a given Python dataclass"""
 
+    __slots__ = ("py_fields",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -930,15 +1105,17 @@ class DataclassSchema(RecordSchema):
         :param options:   Schema generation options.
         """
         super().__init__(py_type, namespace=namespace, options=options)
-        py_type = _type_from_annotated(py_type)
-        self.py_fields = dataclasses.fields(py_type)
-        self.record_fields = [self._record_field(field) for field in self.py_fields]
+        self.py_fields = dataclasses.fields(self._unwrapped_py_type)
+
+    def _make_record_fields(self) -> List[RecordField]:
+        """Return the record's fields"""
+        return [self._record_field(field) for field in self.py_fields]
 
     def _record_field(self, py_field: dataclasses.Field) -> RecordField:
         """Return an Avro record field object for a given dataclass field"""
         default = py_field.default
-        if callable(py_field.default_factory):  # type: ignore
-            default = py_field.default_factory()  # type: ignore
+        if py_field.default_factory is not dataclasses.MISSING:
+            default = py_field.default_factory()
         field_obj = RecordField(
             py_type=py_field.type,
             name=py_field.name,
@@ -953,11 +1130,12 @@ class DataclassSchema(RecordSchema):
 class PydanticSchema(RecordSchema):
     """An Avro record schema for a given Pydantic model class"""
 
+    __slots__ = ("py_fields", "_annotations")
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
-        py_type = _type_from_annotated(py_type)
-        return hasattr(py_type, "__pydantic_private__")
+        return _is_pydantic_model(py_type)
 
     def __init__(self, py_type: Type[pydantic.BaseModel], namespace: Optional[str] = None, options: Option = Option(0)):
         """
@@ -968,16 +1146,31 @@ class PydanticSchema(RecordSchema):
         :param options:   Schema generation options.
         """
         super().__init__(py_type, namespace=namespace, options=options)
-        if Option.USE_CLASS_ALIAS in self.options:
+        if self._options_value & _OPT_USE_CLASS_ALIAS:
             self.name = py_type.model_config.get("title") or self.name
         self.py_fields = py_type.model_fields
-        self.record_fields = [self._record_field(name, field) for name, field in self.py_fields.items()]
+        # Raw annotations across all base classes, subclass annotations overriding base class annotations
+        self._annotations: Dict[str, Type] = {}
+        for class_ in reversed(self._unwrapped_py_type.mro()):
+            self._annotations.update(
+                (name, annotation) for name, annotation in getattr(class_, "__annotations__", {}).items() if annotation
+            )
+        # Resolve string annotations in a single pass where possible. Forward references which cannot be resolved, for
+        # example to classes defined in a function, are kept as raw annotations instead.
+        try:
+            self._annotations.update(get_type_hints(self._unwrapped_py_type, include_extras=True))
+        except (NameError, TypeError):
+            pass
+
+    def _make_record_fields(self) -> List[RecordField]:
+        """Return the record's fields"""
+        return [self._record_field(name, field) for name, field in self.py_fields.items()]
 
     def _record_field(self, name: str, py_field: pydantic.fields.FieldInfo) -> RecordField:
         """Return an Avro record field object for a given Pydantic model field"""
         default = dataclasses.MISSING if py_field.is_required() else py_field.get_default(call_default_factory=True)
         py_type = self._annotation(name)
-        record_name = py_field.alias if Option.USE_FIELD_ALIAS in self.options and py_field.alias else name
+        record_name = py_field.alias if self._options_value & _OPT_USE_FIELD_ALIAS and py_field.alias else name
         field_obj = RecordField(
             py_type=py_type,
             name=record_name,
@@ -994,20 +1187,22 @@ class PydanticSchema(RecordSchema):
 
     def _annotation(self, field_name: str) -> Type:
         """
-        Fetch the raw annotation for a given field name
+        Fetch the annotation for a given field name
 
-        Pydantic "unpacks" annotated and forward ref types in their FieldInfo API. We need to access to full, raw
-        annotated type hints instead.
+        Pydantic "unpacks" annotated and forward ref types in their FieldInfo API. We need to access to full annotated
+        type hints instead.
         """
-        for class_ in self.py_type.mro():
-            if class_.__annotations__.get(field_name):
-                return class_.__annotations__[field_name]
-        raise ValueError(f"{field_name} is not a field of {self.py_type}")  # Should never happen
+        try:
+            return self._annotations[field_name]
+        except KeyError:
+            raise ValueError(f"{field_name} is not a field of {self.py_type}")  # Should never happen
 
 
 class PlainClassSchema(RecordSchema):
     """An Avro record schema for a plain Python class with typed constructor method arguments"""
 
+    __slots__ = ("py_fields",)
+
     @classmethod
     def handles_type(cls, py_type: Type) -> bool:
         """Whether this schema class can represent a given Python class"""
@@ -1016,11 +1211,12 @@ class PlainClassSchema(RecordSchema):
             # Dataclasses are handled above
             not dataclasses.is_dataclass(py_type)
             # Pydantic models are handled above
-            and not hasattr(py_type, "__pydantic_private__")
+            and not _is_pydantic_model(py_type)
             # If we are subclassing a string, used the "named string" approach
-            and (inspect.isclass(py_type) and not issubclass(py_type, str))
-            # Any other class with __init__ with typed args
-            and bool(get_type_hints(py_type.__init__))
+            and (isinstance(py_type, type) and not issubclass(py_type, str))
+            # Any other class with __init__ with typed args. Raw annotations are sufficient here, resolving them using
+            # get_type_hints() is relatively slow.
+            and bool(getattr(py_type.__init__, "__annotations__", None))
         )
 
     def __init__(self, py_type: Type, namespace: Optional[str] = None, options: Option = Option(0)):
@@ -1032,14 +1228,16 @@ class PlainClassSchema(RecordSchema):
         :param options:   Schema generation options.
         """
         super().__init__(py_type, namespace=namespace, options=options)
-        py_type = _type_from_annotated(py_type)
         # Extracting arguments from __init__, dropping first argument `self`.
-        self.py_fields = list(inspect.signature(py_type.__init__).parameters.values())[1:]
-        self.record_fields = [self._record_field(field) for field in self.py_fields]
+        _, *self.py_fields = inspect.signature(self._unwrapped_py_type.__init__).parameters.values()
+
+    def _make_record_fields(self) -> List[RecordField]:
+        """Return the record's fields"""
+        return [self._record_field(field) for field in self.py_fields]
 
     def _record_field(self, py_field: inspect.Parameter) -> RecordField:
         """Return an Avro record field object for a given Python instance attribute"""
-        default = py_field.default if py_field.default != inspect.Parameter.empty else dataclasses.MISSING
+        default = py_field.default if py_field.default is not inspect.Parameter.empty else dataclasses.MISSING
         field_obj = RecordField(
             py_type=py_field.annotation,
             name=py_field.name,
@@ -1050,45 +1248,173 @@ class PlainClassSchema(RecordSchema):
         return field_obj
 
 
+#: Origin of unions using the ``X | Y`` syntax available in Python 3.10+, equivalent to ``typing.Union[X, Y]``
+_UNION_TYPE = getattr(types, "UnionType", Union)
+
+#: Concrete schema classes in the order in which they are tried by :func:`_schema_obj`. Order matters as some Python
+#: types are handled by multiple classes, for example integer enums are handled by both :class:`EnumSchema` and
+#: :class:`PrimitiveSchema`.
+_SCHEMA_CLASSES: Tuple[Type[Schema], ...] = (
+    DataclassSchema,
+    DateSchema,
+    DateTimeSchema,
+    DecimalSchema,
+    DictAsJSONSchema,
+    DictSchema,
+    EnumSchema,
+    ForwardSchema,
+    LiteralSchema,
+    PlainClassSchema,
+    PrimitiveSchema,
+    PydanticSchema,
+    SequenceSchema,
+    StrSubclassSchema,
+    TimeDeltaSchema,
+    TimeSchema,
+    UUIDSchema,
+    UnionSchema,
+)
+#: Schema classes for commonly used Python classes, looked up before trying each schema class in turn. Only exact
+#: classes are included, not their subclasses.
+_SCHEMA_CLASSES_BY_TYPE: Dict[Type, Type[Schema]] = {
+    bool: PrimitiveSchema,
+    bytes: PrimitiveSchema,
+    float: PrimitiveSchema,
+    int: PrimitiveSchema,
+    str: PrimitiveSchema,
+    type(None): PrimitiveSchema,
+    datetime.date: DateSchema,
+    datetime.datetime: DateTimeSchema,
+    datetime.time: TimeSchema,
+    datetime.timedelta: TimeDeltaSchema,
+    decimal.Decimal: DecimalSchema,
+    uuid.UUID: UUIDSchema,
+}
+#: Schema classes for generic types by their origin, looked up before trying each schema class in turn. Only origins
+#: which no other schema class handles are included.
+_SCHEMA_CLASSES_BY_ORIGIN: Dict[Any, Type[Schema]] = {
+    Literal: LiteralSchema,
+    Union: UnionSchema,
+    _UNION_TYPE: UnionSchema,
+}
+
+
+@cache_weakly
+def _module_for_class(py_type: Type) -> Optional[types.ModuleType]:
+    """Return the module a given class is defined in, if any"""
+    return inspect.getmodule(py_type)
+
+
+#: Runs of whitespace including line breaks, collapsed into single spaces in docs
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@cache_weakly
 def _doc_for_class(py_type: Type) -> str:
     """Return the first line of the docstring for a given class, if any"""
     doc = inspect.getdoc(py_type)
     if doc:
         # Take the first sentence
-        doc = doc.split("\n\n", 1)[0].replace("\n", " ").replace("  ", " ").strip()
-        return doc
+        return _WHITESPACE_PATTERN.sub(" ", doc.split("\n\n", 1)[0]).strip()
     else:
         return ""
 
 
+#: Classes for which type checks accept instances of other classes too, for example integers for floats
+_PROMOTED_TYPES = (bytes, complex, float)
+
+
+#: Maximum number of :mod:`typeguard` results cached by :func:`_check_type`
+_CHECK_TYPE_CACHE_MAXSIZE = 4096
+#: Results of :mod:`typeguard` checks by Python type and value id. Values are stored alongside the results such that
+#: cached value ids cannot be re-used.
+_CHECK_TYPE_CACHE: Dict[Tuple[Any, int], Tuple[Any, bool]] = {}
+
+
+def _check_type(value: Any, py_type: Type) -> bool:
+    """
+    Return whether a given value is of a given type
+
+    This avoids relatively slow :mod:`typeguard` checks for plain classes and for ``None`` values of optional types.
+    Other checks are cached for the same type and value object, for example a default value shared by many fields.
+    Values are stored alongside the results such that cached value ids cannot be re-used. Unhashable values such as
+    lists are not cached as they may be modified between checks.
+    """
+    if (type(py_type) is type or type(py_type) is enum.EnumMeta) and py_type not in _PROMOTED_TYPES:
+        return isinstance(value, py_type)
+    if value is None:
+        origin, args = _origin_and_args(py_type)
+        if (origin is Union or origin is _UNION_TYPE) and type(None) in args:
+            return True
+    key = (py_type, id(value))
+    try:
+        hash(value)
+        cached = _CHECK_TYPE_CACHE.get(key)
+    except TypeError:  # Unhashable values or types, for example annotated types with unhashable metadata
+        return _typeguard_check_type(value, py_type)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    result = _typeguard_check_type(value, py_type)
+    if len(_CHECK_TYPE_CACHE) >= _CHECK_TYPE_CACHE_MAXSIZE:
+        _CHECK_TYPE_CACHE.clear()
+    _CHECK_TYPE_CACHE[key] = (value, result)
+    return result
+
+
+def _typeguard_check_type(value: Any, py_type: Type) -> bool:
+    """Return whether a given value is of a given type using :mod:`typeguard`"""
+    try:
+        typeguard.check_type(value, py_type)
+        return True
+    except typeguard.TypeCheckError:
+        return False
+
+
+@cache_by_identity
 def _is_dict_str_any(py_type: Type) -> bool:
     """Return whether a given type is ``Dict[str, Any]``"""
     origin = get_origin(py_type)
-    return inspect.isclass(origin) and issubclass(origin, dict) and get_args(py_type) == (str, Any)
+    if origin is None:  # Not a generic type, by far the most common case
+        return False
+    is_dict = origin is dict or (isinstance(origin, type) and issubclass(origin, dict))
+    return is_dict and get_args(py_type) == (str, Any)
 
 
+@cache_by_identity
 def _is_list_dict_str_any(py_type: Type) -> bool:
     """Return whether a given type is ``List[Dict[str, Any]]``"""
     origin = get_origin(py_type)
+    if origin is None:  # Not a generic type, by far the most common case
+        return False
     args = get_args(py_type)
     if args:
-        return inspect.isclass(origin) and issubclass(origin, list) and _is_dict_str_any(args[0])
+        is_list = origin is list or (isinstance(origin, type) and issubclass(origin, list))
+        return is_list and _is_dict_str_any(args[0])
     else:
         return False
 
 
-def _is_class(py_type: Any, of_types: Union[Type, Tuple[Type, ...]], include_subclasses: bool = True) -> bool:
+@cache_by_identity
+def _is_class(py_type: Any, of_types: Union[Type, Tuple[Type, ...]]) -> bool:
     """Return whether the given type is a (sub) class of a type or types"""
     py_type = _type_from_annotated(py_type)
-    if include_subclasses:
-        return inspect.isclass(py_type) and issubclass(py_type, of_types)
-    else:
-        if isinstance(of_types, tuple):
-            return py_type in of_types
-        else:
-            return py_type == of_types
+    return isinstance(py_type, type) and issubclass(py_type, of_types)
+
+
+def _is_pydantic_model(py_type: Any) -> bool:
+    """Return whether the given type is a Pydantic model class"""
+    pydantic_module = sys.modules.get("pydantic")  # There cannot be any models if Pydantic is not imported at all
+    return pydantic_module is not None and _is_class(py_type, pydantic_module.BaseModel)
+
+
+@cache_by_identity
+def _origin_and_args(py_type: Type) -> Tuple[Any, Tuple[Any, ...]]:
+    """Return the origin and arguments of a given type, ignoring any ``Annotated[{principal_type}, ...]`` wrapper"""
+    py_type = _type_from_annotated(py_type)
+    return get_origin(py_type), get_args(py_type)
 
 
+@cache_by_identity
 def _type_from_annotated(py_type: Type) -> Type:
     """
     Return the "principal" type if the given type is annotated like this ``Annotated[{principal_type}, ...]``
@@ -14,8 +14,7 @@
 Test functions
 """
 import dataclasses
-import difflib
-from typing import Dict, Type, Union
+from typing import Any, Dict, Iterator, Tuple, Type, Union
 
 import avro.schema  # type: ignore
 import orjson
@@ -25,14 +24,18 @@ import py_avro_schema._schemas
 
 def assert_schema(py_type: Type, expected_schema: Union[str, Dict[str, str]], **kwargs) -> None:
     """Test that the given Python type results in the correct Avro schema"""
+    options = kwargs.pop("options", py_avro_schema.Option(0))
     if not kwargs.pop("do_auto_namespace", False):
-        kwargs["options"] = kwargs.get("options", py_avro_schema.Option(0)) | py_avro_schema.Option.NO_AUTO_NAMESPACE
+        options |= py_avro_schema.Option.NO_AUTO_NAMESPACE
     if not kwargs.pop("do_doc", False):
-        kwargs["options"] = kwargs.get("options", py_avro_schema.Option(0)) | py_avro_schema.Option.NO_DOC
-    actual_schema = py_avro_schema._schemas.schema(py_type, **kwargs)
-    expected_schema_json = orjson.dumps(expected_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
-    actual_schema_json = orjson.dumps(actual_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        options |= py_avro_schema.Option.NO_DOC
+    actual_schema = py_avro_schema._schemas.schema(py_type, options=options, **kwargs)
     if actual_schema != expected_schema:
+        import difflib  # Imported here as differences are rarely reported
+
+        # Only serialize schemas for reporting differences
+        expected_schema_json = orjson.dumps(expected_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        actual_schema_json = orjson.dumps(actual_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
         print("Expected schema:")
         print(expected_schema_json)
         print("Actual schema:")
@@ -46,12 +49,44 @@ def assert_schema(py_type: Type, expected_schema: Union[str, Dict[str, str]], **
             n=5,
         ):
             print(diff)
+        print("Differences by path:")
+        for path, expected_value, actual_value in schema_differences(expected_schema, actual_schema):
+            print(f"{path}: expected {expected_value!r}, actual {actual_value!r}")
 
     assert actual_schema == expected_schema
     # Assert that we can parse the schema data as a valid Avro schema
     assert avro.schema.make_avsc_object(actual_schema, None)
 
 
+class _Missing:
+    """Placeholder for a schema item which is missing"""
+
+    def __repr__(self):
+        """Human representation of the placeholder"""
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def schema_differences(expected: Any, actual: Any, path: str = "$") -> Iterator[Tuple[str, Any, Any]]:
+    """
+    Yield the paths and values of schema items which differ between an expected and an actual schema
+
+    :param expected: The expected schema data.
+    :param actual:   The actual schema data.
+    :param path:     The path of the given schema data within the full schema.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in {**expected, **actual}:
+            yield from schema_differences(expected.get(key, _MISSING), actual.get(key, _MISSING), f"{path}.{key}")
+    elif isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            yield from schema_differences(expected_item, actual_item, f"{path}[{i}]")
+    elif type(expected) is not type(actual) or expected != actual:
+        yield path, expected, actual
+
+
 @dataclasses.dataclass
 class PyType:
     """For testing"""
@@ -15,11 +15,11 @@ Additional type hint classes etc
 """
 import dataclasses
 import decimal
+import functools
+import operator
 from typing import _GenericAlias  # type: ignore
 from typing import Optional, Tuple
 
-import typeguard
-
 
 @dataclasses.dataclass(frozen=True)  # Needs to be hashable to work in unioned types
 class DecimalMeta:
@@ -69,10 +69,11 @@ class DecimalType:
     Here, the subscript ``(4, 2)`` refers to the precision and scale of decimal numbers.
     """
 
-    @typeguard.typechecked()
     def __class_getitem__(cls, params: Tuple[int, int]) -> _GenericAlias:
         """Class indexing/subscription using ``DecimalType[precision, scale]"""
-        precision, scale = params
+        if not isinstance(params, tuple) or len(params) != 2:
+            raise TypeError(f"DecimalType requires precision and scale like DecimalType[4, 2]. Given value: {params!r}")
+        precision, scale = map(operator.index, params)  # Integers only, without a relatively slow typeguard check
         if precision <= 0:
             raise ValueError(f"Precision {precision} must be at least 1")
         if scale < 0:
@@ -83,4 +84,10 @@ class DecimalType:
         # scale and precision. That appears to work, but may not be a supported use case. For example, we cannot just do
         # ``DecimalType = _GenericAlias(decimal.Decimal, params)`` because that triggers type enforcement on params.
         # Instead we create new custom class with :meth:`__class_getitem__` returning the "generic".
-        return _GenericAlias(decimal.Decimal, params)
+        return _decimal_alias(precision, scale)
+
+
+@functools.lru_cache(maxsize=None)
+def _decimal_alias(precision: int, scale: int) -> _GenericAlias:
+    """Return a decimal type alias for a given precision and scale, re-using aliases for repeated subscriptions"""
+    return _GenericAlias(decimal.Decimal, (precision, scale))
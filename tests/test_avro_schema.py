@@ -9,18 +9,53 @@
 # "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import concurrent.futures
 import dataclasses
+import gc
+import inspect
+import weakref
+from typing import Annotated, List, Literal, Optional, Tuple, Union, get_origin
 
 import avro.schema
 import orjson
+import pytest
 
 import py_avro_schema as pas
+import py_avro_schema._cache
+import py_avro_schema._schemas
+from py_avro_schema._testing import schema_differences
 
 
 def test_package_has_version():
     assert pas.__version__ is not None
 
 
+def test_schema_classes_complete():
+    schema_classes = {
+        obj
+        for _, obj in inspect.getmembers(py_avro_schema._schemas, inspect.isclass)
+        if issubclass(obj, py_avro_schema._schemas.Schema) and not inspect.isabstract(obj)
+    }
+    assert set(py_avro_schema._schemas._SCHEMA_CLASSES) == schema_classes
+
+
+def test_schema_classes_by_type():
+    for py_type, schema_class in py_avro_schema._schemas._SCHEMA_CLASSES_BY_TYPE.items():
+        handling_classes = [cls for cls in py_avro_schema._schemas._SCHEMA_CLASSES if cls.handles_type(py_type)]
+        assert handling_classes[0] is schema_class
+
+
+def test_schema_classes_by_origin():
+    for py_type in (Literal["a", "b"], Optional[str], Union[int, str], Union[Annotated[int, ...], None]):
+        handling_classes = [cls for cls in py_avro_schema._schemas._SCHEMA_CLASSES if cls.handles_type(py_type)]
+        assert handling_classes == [py_avro_schema._schemas._SCHEMA_CLASSES_BY_ORIGIN[get_origin(py_type)]]
+
+
+def test_schema_classes_slots():
+    for schema_class in (*py_avro_schema._schemas._SCHEMA_CLASSES, py_avro_schema._schemas.RecordField):
+        assert "__dict__" not in dir(schema_class), f"{schema_class.__name__} instances have a __dict__"
+
+
 def test_dataclass_string_field():
     @dataclasses.dataclass
     class PyType:
@@ -43,3 +78,232 @@ def test_dataclass_string_field():
     json_data = pas.generate(PyType)
     assert json_data == orjson.dumps(expected)
     assert avro.schema.parse(json_data)
+
+
+def test_generate_cached():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: str
+
+    json_data = pas.generate(PyType)
+    assert pas.generate(PyType) is json_data
+    assert pas.generate(PyType, options=pas.Option.JSON_INDENT_2) != json_data
+    pas.generate.cache_clear()
+    assert pas.generate(PyType) is not json_data
+    assert pas.generate(PyType) == json_data
+
+
+def test_clear_caches():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: str
+
+    json_data = pas.generate(PyType)
+    PyType.__annotations__["field_a"] = int
+    PyType.__dataclass_fields__["field_a"].type = int
+    assert pas.generate(PyType) is json_data
+    pas.clear_caches()
+    assert b'"long"' in pas.generate(PyType)
+
+
+def test_check_type_cached():
+    py_type = Tuple[str, ...]
+    value = ("a", "b")
+    assert py_avro_schema._schemas._check_type(value, py_type)
+    assert py_avro_schema._schemas._CHECK_TYPE_CACHE[(py_type, id(value))] == (value, True)
+    assert not py_avro_schema._schemas._check_type((1, "a"), py_type)
+    pas.clear_caches()
+    assert not py_avro_schema._schemas._CHECK_TYPE_CACHE
+
+
+def test_check_type_mutable_value_not_cached():
+    py_type = List[str]
+    value = ["a"]
+    assert py_avro_schema._schemas._check_type(value, py_type)
+    value[0] = 1
+    assert not py_avro_schema._schemas._check_type(value, py_type)
+    assert (py_type, id(value)) not in py_avro_schema._schemas._CHECK_TYPE_CACHE
+
+
+def test_generate_many():
+    @dataclasses.dataclass
+    class Child:
+        field_a: str
+
+    @dataclasses.dataclass
+    class PyType1:
+        field_a: Child
+
+    @dataclasses.dataclass
+    class PyType2:
+        field_a: Child
+
+    child_schema = {
+        "type": "record",
+        "name": "Child",
+        "fields": [{"name": "field_a", "type": "string"}],
+    }
+    options = pas.Option.NO_AUTO_NAMESPACE | pas.Option.NO_DOC
+    json_data = pas.generate_many([PyType1, PyType2], options=options)
+    assert json_data == [
+        orjson.dumps({"type": "record", "name": "PyType1", "fields": [{"name": "field_a", "type": child_schema}]}),
+        orjson.dumps({"type": "record", "name": "PyType2", "fields": [{"name": "field_a", "type": "Child"}]}),
+    ]
+    names = avro.schema.Names()
+    for schema_json in json_data:
+        assert avro.schema.make_avsc_object(orjson.loads(schema_json), names)
+
+
+def test_generate_cache_maxsize(monkeypatch):
+    monkeypatch.setattr(pas, "_GENERATE_CACHE_MAXSIZE", 2)
+    pas.generate.cache_clear()
+    json_data = pas.generate(str)
+    pas.generate(int)
+    assert pas.generate(str) is json_data  # str is now most recently used
+    pas.generate(float)  # Evicts int
+    assert len(pas._GENERATE_CACHE) == 2
+    assert pas.generate(str) is json_data
+
+
+def test_cache_maxsize_from_env(monkeypatch):
+    monkeypatch.setenv("PY_AVRO_SCHEMA_CACHE", "16")
+    assert py_avro_schema._cache.maxsize_from_env() == 16
+
+
+def test_cache_maxsize_from_env_zero(monkeypatch):
+    monkeypatch.setenv("PY_AVRO_SCHEMA_CACHE", "0")
+    assert py_avro_schema._cache.maxsize_from_env() == 0
+
+
+def test_cache_maxsize_from_env_negative(monkeypatch):
+    monkeypatch.setenv("PY_AVRO_SCHEMA_CACHE", "-1")
+    with pytest.raises(ValueError, match="Environment variable PY_AVRO_SCHEMA_CACHE must be a non-negative integer"):
+        py_avro_schema._cache.maxsize_from_env()
+
+
+def test_cache_maxsize_from_env_not_a_number(monkeypatch):
+    monkeypatch.setenv("PY_AVRO_SCHEMA_CACHE", "many")
+    with pytest.raises(ValueError, match="Environment variable PY_AVRO_SCHEMA_CACHE must be a non-negative integer"):
+        py_avro_schema._cache.maxsize_from_env()
+
+
+def test_generate_cache_disabled(monkeypatch):
+    monkeypatch.setattr(pas, "_GENERATE_CACHE_MAXSIZE", 0)
+    monkeypatch.setattr(py_avro_schema._cache, "MAXSIZE", 0)
+    pas.clear_caches()
+    assert pas.generate(int) == b'"long"'
+    assert pas.generate(int) == b'"long"'
+    assert not pas._GENERATE_CACHE
+
+
+def test_generate_cache_negative_maxsize(monkeypatch):
+    monkeypatch.setattr(pas, "_GENERATE_CACHE_MAXSIZE", -1)
+    monkeypatch.setattr(py_avro_schema._cache, "MAXSIZE", -1)
+    assert pas.generate(int) == b'"long"'
+    assert not pas._GENERATE_CACHE
+
+
+def test_caches_release_types(monkeypatch):
+    monkeypatch.setattr(pas, "_GENERATE_CACHE_MAXSIZE", 8)
+    monkeypatch.setattr(py_avro_schema._cache, "MAXSIZE", 8)
+    py_types = [dataclasses.make_dataclass(f"PyType{i}", [("field_a", str)]) for i in range(32)]
+    for py_type in py_types:
+        pas.generate(py_type)
+    refs = [weakref.ref(py_type) for py_type in py_types]
+    del py_types, py_type
+    gc.collect()
+    assert sum(ref() is not None for ref in refs) <= 8
+
+
+def test_generate_into():
+    buffer = bytearray(b"schemas:")
+    assert pas.generate_into(str, buffer) == 8
+    assert pas.generate_into(int, buffer, options=pas.Option.INT_32) == 5
+    assert buffer == b'schemas:"string""int"'
+
+
+def test_make_generator():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: int
+
+    generate = pas.make_generator(namespace="my.namespace", options=pas.Option.INT_32)
+    json_data = generate(PyType)
+    assert json_data == pas.generate(PyType, namespace="my.namespace", options=pas.Option.INT_32)
+    assert generate(PyType) is json_data
+
+
+def test_make_generator_clear_caches():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: str
+
+    generate = pas.make_generator()
+    json_data = generate(PyType)
+    PyType.__annotations__["field_a"] = int
+    PyType.__dataclass_fields__["field_a"].type = int
+    assert generate(PyType) is json_data
+    pas.clear_caches()
+    assert b'"long"' in generate(PyType)
+
+
+def test_make_generator_unhashable():
+    generate = pas.make_generator()
+    py_type = Annotated[str, {"key": "value"}]
+    assert generate(py_type) == b'"string"'
+    assert generate(py_type) is generate(py_type)
+
+
+def test_make_generator_union_order():
+    generate = pas.make_generator()
+    assert generate(Union[int, str]) == b'["long","string"]'
+    assert generate(Union[str, int]) == b'["string","long"]'
+
+
+def test_generate_json_options_reuse_schema_data(monkeypatch):
+    @dataclasses.dataclass
+    class PyType:
+        field_a: str
+
+    json_data = pas.generate(PyType)
+    monkeypatch.setattr(pas, "schema", None)  # Schema data must be taken from the cache
+    json_data_sorted = pas.generate(PyType, options=pas.Option.JSON_INDENT_2 | pas.Option.JSON_SORT_KEYS)
+    assert orjson.loads(json_data_sorted) == orjson.loads(json_data)
+
+
+def test_generate_equivalent_options_reuse_schema_data(monkeypatch):
+    @dataclasses.dataclass
+    class PyType:
+        field_a: str
+
+    pas.generate(PyType, namespace="my.namespace")
+    monkeypatch.setattr(pas, "schema", None)  # Schema data must be taken from the cache
+    pas.generate(PyType, namespace="my.namespace", options=pas.Option.AUTO_NAMESPACE_MODULE)
+
+
+def test_generate_union_order():
+    assert pas.generate(Union[int, str]) == b'["long","string"]'
+    assert pas.generate(Union[str, int]) == b'["string","long"]'
+
+
+def test_generate_threads(monkeypatch):
+    monkeypatch.setattr(pas, "_GENERATE_CACHE_MAXSIZE", 8)
+    py_types = [dataclasses.make_dataclass(f"PyType{i}", [("field_a", str)]) for i in range(32)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        json_data = list(executor.map(pas.generate, py_types * 4))
+    assert json_data == [pas.generate(py_type) for py_type in py_types] * 4
+    assert pas.generate.cache_info().currsize <= 8
+
+
+def test_generate_equal_schemas_share_bytes():
+    assert pas.generate(Annotated[str, "meta"]) is pas.generate(str)
+
+
+def test_schema_differences():
+    expected = {"type": "record", "fields": [{"name": "field_a", "type": "long"}]}
+    actual = {"type": "record", "fields": [{"name": "field_a", "type": "int", "default": 0}]}
+    differences = [(path, repr(a), repr(b)) for path, a, b in schema_differences(expected, actual)]
+    assert differences == [
+        ("$.fields[0].type", "'long'", "'int'"),
+        ("$.fields[0].default", "<missing>", "0"),
+    ]
@@ -14,12 +14,13 @@ import datetime
 import decimal
 import enum
 import re
-from typing import Annotated, Dict, List, Optional, Tuple
+from typing import Annotated, Dict, List, Optional, Tuple, Union
 
 import pytest
 import typeguard
 
 import py_avro_schema as pas
+import py_avro_schema._schemas
 from py_avro_schema._testing import assert_schema
 
 
@@ -139,6 +140,86 @@ def test_optional_field_default():
     assert_schema(PyType, expected)
 
 
+def test_optional_fields_different_defaults():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: Optional[str] = None
+        field_b: Optional[str] = ""
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "fields": [
+            {
+                "name": "field_a",
+                "type": ["null", "string"],
+                "default": None,
+            },
+            {
+                "name": "field_b",
+                "type": ["string", "null"],
+                "default": "",
+            },
+        ],
+    }
+    assert_schema(PyType, expected)
+
+
+def test_optional_list_field_none_default():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: Optional[List[str]] = None
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "fields": [
+            {
+                "name": "field_a",
+                "type": ["null", {"type": "array", "items": "string"}],
+                "default": None,
+            }
+        ],
+    }
+    assert_schema(PyType, expected)
+
+
+def test_union_fields_different_order():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: Union[int, str]
+        field_b: Union[str, int]
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "fields": [
+            {"name": "field_a", "type": ["long", "string"]},
+            {"name": "field_b", "type": ["string", "long"]},
+        ],
+    }
+    assert_schema(PyType, expected)
+
+
+def test_union_float_field_int_default():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: Union[str, float] = 1
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "fields": [
+            {
+                "name": "field_a",
+                "type": ["double", "string"],
+                "default": 1,
+            }
+        ],
+    }
+    assert_schema(PyType, expected)
+
+
 def test_list_string_field():
     @dataclasses.dataclass
     class PyType:
@@ -182,6 +263,15 @@ def test_list_string_field_default():
     assert_schema(PyType, expected)
 
 
+def test_list_string_field_default_not_shared():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: List[str] = dataclasses.field(default_factory=lambda: ["a"])
+
+    py_avro_schema._schemas.schema(PyType)["fields"][0]["default"].append("b")
+    assert py_avro_schema._schemas.schema(PyType)["fields"][0]["default"] == ["a"]
+
+
 def test_list_string_field_default_wrong_type():
     @dataclasses.dataclass
     class PyType:
@@ -754,6 +844,28 @@ def test_datetime_field_default():
     assert_schema(PyType, expected)
 
 
+def test_datetime_field_default_microseconds():
+    @dataclasses.dataclass
+    class PyType:
+        field_a: datetime.datetime = datetime.datetime(9999, 12, 31, 23, 59, 59, 999_999, tzinfo=datetime.timezone.utc)
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "fields": [
+            {
+                "name": "field_a",
+                "type": {
+                    "type": "long",
+                    "logicalType": "timestamp-micros",
+                },
+                "default": 253_402_300_799_999_999,
+            }
+        ],
+    }
+    assert_schema(PyType, expected)
+
+
 def test_datetime_field_default_no_tzinfo():
     @dataclasses.dataclass
     class PyType:
@@ -825,6 +937,30 @@ def test_class_docstring_multiline():
     assert_schema(PyType, expected, do_doc=True)
 
 
+def test_class_docstring_whitespace():
+    @dataclasses.dataclass
+    class PyType:
+        """
+        My   PyType	with
+          indented   wrapping
+        """
+
+        field_a: str
+
+    expected = {
+        "type": "record",
+        "name": "PyType",
+        "doc": "My PyType with indented wrapping",
+        "fields": [
+            {
+                "name": "field_a",
+                "type": "string",
+            }
+        ],
+    }
+    assert_schema(PyType, expected, do_doc=True)
+
+
 def test_sequence_schema_defaults_with_items():
     @dataclasses.dataclass
     class PyType:
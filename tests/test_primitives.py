@@ -44,6 +44,12 @@ def test_str_annotated():
     assert_schema(py_type, expected)
 
 
+def test_str_annotated_unhashable():
+    py_type = Annotated[str, {"key": "value"}]
+    expected = "string"
+    assert_schema(py_type, expected)
+
+
 def test_str_subclass():
     class PyType(str): ...
 
@@ -113,6 +119,20 @@ def test_int_32():
     assert_schema(py_type, expected, options=options)
 
 
+def test_int_32_annotated():
+    py_type = Annotated[int, ...]
+    expected = "int"
+    options = pas.Option.INT_32
+    assert_schema(py_type, expected, options=options)
+
+
+def test_bool_int_32():
+    py_type = bool
+    expected = "boolean"
+    options = pas.Option.INT_32
+    assert_schema(py_type, expected, options=options)
+
+
 def test_int_literal():
     py_type = Literal[42]
     expected = "long"
@@ -273,6 +293,12 @@ def test_string_dict_int_keys():
         py_avro_schema._schemas.schema(py_type)
 
 
+def test_dict_no_args():
+    py_type = Dict
+    with pytest.raises(pas.TypeNotSupportedError):
+        py_avro_schema._schemas.schema(py_type)
+
+
 def test_string_mapping():
     py_type = Mapping[str, str]
     expected = {"type": "map", "values": "string"}
@@ -346,6 +372,16 @@ def test_union_string_string_int_py310():
     assert_schema(py_type, expected)
 
 
+def test_union_int_string_order():
+    assert_schema(Union[int, str], ["long", "string"])
+    assert_schema(Union[str, int], ["string", "long"])  # Equal to the previous union, but in a different order
+
+
+def test_union_int_string_order_nested():
+    assert_schema(list[Union[int, str]], {"type": "array", "items": ["long", "string"]})
+    assert_schema(list[Union[str, int]], {"type": "array", "items": ["string", "long"]})
+
+
 def test_union_of_union_string_int():
     py_type = Union[str, Union[str, int]]
     expected = ["string", "long"]
@@ -409,6 +445,15 @@ def test_enum():
     assert_schema(PyType, expected)
 
 
+def test_enum_data_not_shared():
+    class PyType(enum.Enum):
+        RED = "RED"
+        GREEN = "GREEN"
+
+    py_avro_schema._schemas.schema(PyType)["symbols"].append("BLUE")
+    assert py_avro_schema._schemas.schema(PyType)["symbols"] == ["RED", "GREEN"]
+
+
 def test_enum_annotated():
     class PyType(enum.Enum):
         RED = "RED"
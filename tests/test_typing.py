@@ -56,6 +56,11 @@ def test_decimal_type():
     assert py_type.__args__ == (4, 2)
 
 
+def test_decimal_type_reused():
+    assert DecimalType[4, 2] is DecimalType[4, 2]
+    assert DecimalType[4, 2] is not DecimalType[4, 1]
+
+
 def test_instance_check():
     py_type = DecimalType[4, 2]
     typeguard.check_type(decimal.Decimal("1.23"), py_type)
@@ -82,5 +87,10 @@ def test_precision_lt_scale():
 
 
 def test_bad_indexing():
-    with pytest.raises(typeguard.TypeCheckError, match=re.escape('argument "params" (int) is not a tuple')):
+    with pytest.raises(TypeError, match=re.escape("DecimalType requires precision and scale like DecimalType[4, 2]")):
         DecimalType[4]
+
+
+def test_non_integer_indexing():
+    with pytest.raises(TypeError, match="'float' object cannot be interpreted as an integer"):
+        DecimalType[4.0, 2]